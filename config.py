@@ -23,6 +23,9 @@ DEFAULT_MODE = "charge"
 
 MIN_RESISTANCE = 1e-9
 MIN_CAPACITANCE = 1e-12
+# Past this many time constants the decaying term is below ~1e-17 of its
+# initial amplitude, so the analytic solution treats it as zero.
+DECAY_CUTOFF_TAUS = 40.0
 
 LOOP_LEFT = -420
 LOOP_RIGHT = 420
@@ -31,6 +34,7 @@ LOOP_BOTTOM = -180
 BOTTOM_WIRE_Y = LOOP_BOTTOM
 
 NUM_CHARGE_MARKERS = 18
+CHARGE_MARKER_RADIUS = 5.5
 
 FPS_BASE_DELAY_MS = 20
 MAX_PHYSICS_STEPS_PER_FRAME = 200
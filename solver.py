@@ -3,6 +3,7 @@
 import math
 from dataclasses import dataclass
 from circuit import SeriesRCCircuit
+from config import DECAY_CUTOFF_TAUS
 
 
 @dataclass
@@ -66,6 +67,8 @@ class RCCircuitSimulator:
         if initial_capacitor_voltage is not None:
             self.initial_capacitor_voltage = float(initial_capacitor_voltage)
 
+        self._cache_circuit_constants()
+        self._cache_analytic_constants()
         self.state = SimulationState()
         self.state.Vc = self.initial_capacitor_voltage
         self._update_derived()
@@ -93,29 +96,53 @@ class RCCircuitSimulator:
         self.history["Q"].append(self.state.Q)
         self.history["Vr"].append(self.state.Vr)
 
+    def _cache_circuit_constants(self):
+        # R_eq and C_eq re-sum the component lists on every access, and the
+        # step loop runs up to MAX_PHYSICS_STEPS_PER_FRAME times per frame.
+        self._R = self.circuit.R_eq
+        self._C = self.circuit.C_eq
+        self._inv_R = 1.0 / self._R
+        self._inv_RC = 1.0 / (self._R * self._C)
+
+    def _cache_analytic_constants(self):
+        # Mode and Vc(0) are fixed until the next reset, so the analytic
+        # solution reduces to Vc(t) = Vc_inf + Vc_amp * e(t), I(t) = I0 * e(t).
+        V_source = self.circuit.source_voltage
+        Vc0 = self.initial_capacitor_voltage
+        tau = self._R * self._C
+
+        self._inv_tau = 1.0 / tau
+        self._decay_cutoff_t = DECAY_CUTOFF_TAUS * tau
+
+        if self.mode == "charge":
+            self._vc_inf = V_source
+            self._vc_amp = Vc0 - V_source
+            self._i0 = (V_source - Vc0) * self._inv_R
+        else:
+            self._vc_inf = 0.0
+            self._vc_amp = Vc0
+            self._i0 = -Vc0 * self._inv_R
+
     def _update_derived(self):
         V_source = self.circuit.source_voltage
-        R = self.circuit.R_eq
         Vc = self.state.Vc
 
         if self.mode == "charge":
-            self.state.I = (V_source - Vc) / R
+            self.state.I = (V_source - Vc) * self._inv_R
             self.state.Vr = V_source - Vc
         else:
-            self.state.I = -Vc / R
+            self.state.I = -Vc * self._inv_R
             self.state.Vr = -Vc
 
-        self.state.Q = self.circuit.C_eq * Vc
+        self.state.Q = self._C * Vc
 
     def _single_step(self, dt_step: float):
         V_source = self.circuit.source_voltage
-        R = self.circuit.R_eq
-        C = self.circuit.C_eq
 
         if self.mode == "charge":
-            dVc_dt = (V_source - self.state.Vc) / (R * C)
+            dVc_dt = (V_source - self.state.Vc) * self._inv_RC
         else:
-            dVc_dt = -(self.state.Vc) / (R * C)
+            dVc_dt = -(self.state.Vc) * self._inv_RC
 
         self.state.Vc += dVc_dt * dt_step
         self.state.t += dt_step
@@ -177,27 +204,19 @@ class RCCircuitSimulator:
 
         return consumed, steps_taken
 
-    def analytic_vc(self, t: float) -> float:
-        tau = self.circuit.tau
-        V_source = self.circuit.source_voltage
-        Vc0 = self.initial_capacitor_voltage
+    def _decay(self, t: float) -> float:
+        if t > self._decay_cutoff_t:
+            return 0.0
+        return math.exp(-t * self._inv_tau)
 
-        if self.mode == "charge":
-            return V_source + (Vc0 - V_source) * math.exp(-t / tau)
-        return Vc0 * math.exp(-t / tau)
+    def analytic_vc(self, t: float) -> float:
+        return self._vc_inf + self._vc_amp * self._decay(t)
 
     def analytic_i(self, t: float) -> float:
-        R = self.circuit.R_eq
-        V_source = self.circuit.source_voltage
-        Vc0 = self.initial_capacitor_voltage
-        tau = self.circuit.tau
-
-        if self.mode == "charge":
-            return ((V_source - Vc0) / R) * math.exp(-t / tau)
-        return -(Vc0 / R) * math.exp(-t / tau)
+        return self._i0 * self._decay(t)
 
     def analytic_q(self, t: float) -> float:
-        return self.circuit.C_eq * self.analytic_vc(t)
+        return self._C * self.analytic_vc(t)
 
     def is_effectively_finished(self, frac: float = 0.999) -> bool:
         V_source = self.circuit.source_voltage
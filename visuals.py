@@ -1,8 +1,10 @@
 # visuals.py
 
-import math
 import time
 import turtle
+from dataclasses import dataclass
+
+import numpy as np
 
 from config import (
     WINDOW_WIDTH,
@@ -25,6 +27,7 @@ from config import (
     LOOP_BOTTOM,
     BOTTOM_WIRE_Y,
     NUM_CHARGE_MARKERS,
+    CHARGE_MARKER_RADIUS,
     FPS_BASE_DELAY_MS,
     MAX_PHYSICS_STEPS_PER_FRAME,
     INFO_POS,
@@ -34,6 +37,53 @@ from config import (
 )
 
 
+# Resistor zigzag relative to the component centre.
+RESISTOR_ZIGZAG = (
+    (-30, 0),
+    (-20, 12),
+    (-10, -12),
+    (0, 12),
+    (10, -12),
+    (20, 12),
+    (30, 0),
+)
+
+
+@dataclass
+class RectLoopIndex:
+    """
+    Arc-length lookup for an axis-aligned rectangle walked counter-clockwise
+    from its bottom-left corner. Lookups are closed-form: clamping the
+    distance against each side gives both coordinates without a segment search.
+    """
+
+    left: float
+    bottom: float
+    width: float
+    height: float
+    total_length: float
+
+    @classmethod
+    def from_bounds(cls, left, bottom, right, top):
+        width = float(right - left)
+        height = float(top - bottom)
+        return cls(float(left), float(bottom), width, height, 2.0 * (width + height))
+
+    def locate_many(self, distances):
+        """Return (xs, ys) arrays for an array of distances along the loop."""
+        d = np.mod(distances, self.total_length)
+        w, h = self.width, self.height
+
+        xs = np.minimum(d, w)
+        xs -= np.minimum(np.maximum(d - (w + h), 0.0), w)
+        xs += self.left
+
+        ys = np.minimum(np.maximum(d - w, 0.0), h)
+        ys -= np.maximum(d - (2 * w + h), 0.0)
+        ys += self.bottom
+        return xs, ys
+
+
 class CircuitVisualizer:
     def __init__(self, circuit, simulator, total_time, v_sim):
         self.circuit = circuit
@@ -56,6 +106,11 @@ class CircuitVisualizer:
         self.screen.bgcolor(BG_COLOR)
         self.screen.title("Series RC Circuit Simulation v4")
         self.screen.tracer(0, 0)
+        self.canvas = self.screen.getcanvas()
+        # Turtle's canvas is centred on the world origin, so world -> canvas
+        # is a pure scale with y flipped. Bake it once for direct canvas calls.
+        self.canvas_sx = self.screen.xscale
+        self.canvas_sy = -self.screen.yscale
 
         self.drawer = turtle.Turtle(visible=False)
         self.drawer.speed(0)
@@ -81,15 +136,18 @@ class CircuitVisualizer:
         self.status_writer.color(WARNING_COLOR)
         self.status_writer.penup()
 
+        self.gauge_writer = turtle.Turtle(visible=False)
+        self.gauge_writer.speed(0)
+        self.gauge_writer.penup()
+
         self.component_positions = self._compute_component_positions()
-        self.path_points, self.path_lengths, self.total_path_length = self._build_loop_path()
-        self.marker_distances = [
-            i * self.total_path_length / NUM_CHARGE_MARKERS
-            for i in range(NUM_CHARGE_MARKERS)
-        ]
+        self.loop_path = self._build_loop_path()
+        self.total_path_length = self.loop_path.total_length
         self.markers = [self._make_charge_marker() for _ in range(NUM_CHARGE_MARKERS)]
+        self._reset_markers()
 
         self._bind_keys()
+        self._draw_static_scene()
         self.refresh()
 
     def decrease_speed(self):
@@ -141,13 +199,15 @@ class CircuitVisualizer:
         self.screen.onkey(self.increase_speed, "]")
 
     def _make_charge_marker(self):
-        marker = turtle.Turtle()
-        marker.shape("circle")
-        marker.shapesize(0.55, 0.55)
-        marker.penup()
-        marker.speed(0)
-        marker.color(CHARGE_COLOR)
-        return marker
+        # Plain canvas ovals instead of Turtles: moving them is a single
+        # coords() call, without the turtle goto/undo/redraw machinery.
+        r = CHARGE_MARKER_RADIUS
+        return self.canvas.create_oval(
+            -r, -r, r, r,
+            fill=CHARGE_COLOR,
+            outline=CHARGE_COLOR,
+            tags=("charge_marker",),
+        )
 
     def toggle_pause(self):
         self.paused = not self.paused
@@ -181,19 +241,25 @@ class CircuitVisualizer:
             pass
 
     def _reset_markers(self):
-        self.marker_distances = [
-            i * self.total_path_length / NUM_CHARGE_MARKERS
-            for i in range(NUM_CHARGE_MARKERS)
-        ]
+        self.marker_distances = np.linspace(
+            0.0, self.total_path_length, NUM_CHARGE_MARKERS, endpoint=False
+        )
+        self._place_markers()
 
     def set_flash_message(self, message, duration=1.2):
         self.flash_message = message
         self.flash_message_expire_time = time.perf_counter() + duration
 
+    def _flash_message_expired(self):
+        return bool(self.flash_message) and time.perf_counter() > self.flash_message_expire_time
+
     def _update_flash_message(self):
         now = time.perf_counter()
 
-        if now <= self.flash_message_expire_time and self.flash_message:
+        if now > self.flash_message_expire_time:
+            self.flash_message = ""
+
+        if self.flash_message:
             self.status_writer.goto(-40, 315)
             self.status_writer.color(ACCENT_COLOR)
             self.status_writer.write(
@@ -237,53 +303,32 @@ class CircuitVisualizer:
         return positions
 
     def _build_loop_path(self):
-        pts = [
-            (LOOP_LEFT, BOTTOM_WIRE_Y),
-            (LOOP_RIGHT, BOTTOM_WIRE_Y),
-            (LOOP_RIGHT, LOOP_TOP),
-            (LOOP_LEFT, LOOP_TOP),
-            (LOOP_LEFT, BOTTOM_WIRE_Y),
-        ]
-
-        lengths = []
-        total = 0.0
-        for i in range(len(pts) - 1):
-            x1, y1 = pts[i]
-            x2, y2 = pts[i + 1]
-            seg_len = math.hypot(x2 - x1, y2 - y1)
-            lengths.append(seg_len)
-            total += seg_len
-
-        return pts, lengths, total
-
-    def _point_on_path(self, distance):
-        distance %= self.total_path_length
-        accumulated = 0.0
-
-        for i, seg_len in enumerate(self.path_lengths):
-            if accumulated + seg_len >= distance:
-                x1, y1 = self.path_points[i]
-                x2, y2 = self.path_points[i + 1]
-                frac = (distance - accumulated) / seg_len if seg_len > 0 else 0.0
-                return x1 + frac * (x2 - x1), y1 + frac * (y2 - y1)
-            accumulated += seg_len
-
-        return self.path_points[-1]
-
-    def _draw_line(self, x1, y1, x2, y2, color=WIRE_COLOR, pensize=3):
-        self.drawer.penup()
-        self.drawer.goto(x1, y1)
-        self.drawer.pendown()
-        self.drawer.color(color)
-        self.drawer.pensize(pensize)
-        self.drawer.goto(x2, y2)
-        self.drawer.penup()
-
-    def _draw_text(self, x, y, text, color=TEXT_COLOR, align="center", font=("Arial", 11, "normal")):
-        self.drawer.penup()
-        self.drawer.goto(x, y)
-        self.drawer.color(color)
-        self.drawer.write(text, align=align, font=font)
+        return RectLoopIndex.from_bounds(LOOP_LEFT, BOTTOM_WIRE_Y, LOOP_RIGHT, LOOP_TOP)
+
+    def _draw_line(self, x1, y1, x2, y2, color=WIRE_COLOR, pensize=3, tag="scene"):
+        self._draw_polyline([(x1, y1), (x2, y2)], color=color, pensize=pensize, tag=tag)
+
+    def _draw_polyline(self, pts, color=WIRE_COLOR, pensize=3, tag="scene"):
+        # One Tk create_line per polyline instead of a turtle goto per vertex.
+        # Items are tagged so they can be cleared along with their text writer.
+        sx, sy = self.canvas_sx, self.canvas_sy
+        coords = [c for x, y in pts for c in (x * sx, y * sy)]
+
+        self.canvas.create_line(
+            *coords,
+            fill=color,
+            width=pensize,
+            capstyle="round",
+            tags=(tag,),
+        )
+
+    def _draw_text(self, x, y, text, color=TEXT_COLOR, align="center", font=("Arial", 11, "normal"), writer=None):
+        if writer is None:
+            writer = self.drawer
+        writer.penup()
+        writer.goto(x, y)
+        writer.color(color)
+        writer.write(text, align=align, font=font)
 
     def _draw_grid(self):
         spacing = 80
@@ -307,23 +352,8 @@ class CircuitVisualizer:
         self._draw_line(x - 45, y, x - 30, y, color=WIRE_COLOR, pensize=3)
         self._draw_line(x + 30, y, x + 45, y, color=WIRE_COLOR, pensize=3)
 
-        pts = [
-            (x - 30, y),
-            (x - 20, y + 12),
-            (x - 10, y - 12),
-            (x, y + 12),
-            (x + 10, y - 12),
-            (x + 20, y + 12),
-            (x + 30, y),
-        ]
-        self.drawer.penup()
-        self.drawer.goto(pts[0])
-        self.drawer.pendown()
-        self.drawer.color(RESISTOR_COLOR)
-        self.drawer.pensize(3)
-        for pt in pts[1:]:
-            self.drawer.goto(pt)
-        self.drawer.penup()
+        pts = [(x + dx, y + dy) for dx, dy in RESISTOR_ZIGZAG]
+        self._draw_polyline(pts, color=RESISTOR_COLOR, pensize=3)
 
         self._draw_text(x, y + COMPONENT_LABEL_OFFSET_Y, f"{label}: {value:.3g} Ω", color=RESISTOR_COLOR)
 
@@ -338,11 +368,15 @@ class CircuitVisualizer:
 
     def _draw_outer_wires(self):
         self._draw_line(LOOP_LEFT, LOOP_BOTTOM, LOOP_RIGHT, LOOP_BOTTOM, color=WIRE_COLOR, pensize=3)
-        self._draw_line(LOOP_LEFT, LOOP_TOP, LOOP_RIGHT, LOOP_TOP, color=WIRE_COLOR, pensize=2)
-        self._draw_line(LOOP_RIGHT, LOOP_TOP, LOOP_RIGHT, LOOP_BOTTOM, color=WIRE_COLOR, pensize=2)
+        self._draw_polyline(
+            [(LOOP_LEFT, LOOP_TOP), (LOOP_RIGHT, LOOP_TOP), (LOOP_RIGHT, LOOP_BOTTOM)],
+            color=WIRE_COLOR,
+            pensize=2,
+        )
 
     def _draw_static_scene(self):
         self.drawer.clear()
+        self.canvas.delete("scene")
         self._draw_grid()
         self._draw_outer_wires()
         self._draw_battery()
@@ -410,10 +444,13 @@ class CircuitVisualizer:
         y = 100
         width = 24 + 55 * frac
 
-        self._draw_text(x - 20, y + 65, "Capacitor Charge", color=TEXT_COLOR)
-        self._draw_line(x - width / 2, y + 20, x + width / 2, y + 20, color=CAP_POS_COLOR, pensize=6)
-        self._draw_line(x - width / 2, y - 20, x + width / 2, y - 20, color=CAP_NEG_COLOR, pensize=6)
-        self._draw_text(x, y - 60, f"|Vc| scale: {100 * frac:.1f}%", color=ACCENT_COLOR)
+        self.gauge_writer.clear()
+        self.canvas.delete("gauge")
+
+        self._draw_text(x - 20, y + 65, "Capacitor Charge", color=TEXT_COLOR, writer=self.gauge_writer)
+        self._draw_line(x - width / 2, y + 20, x + width / 2, y + 20, color=CAP_POS_COLOR, pensize=6, tag="gauge")
+        self._draw_line(x - width / 2, y - 20, x + width / 2, y - 20, color=CAP_NEG_COLOR, pensize=6, tag="gauge")
+        self._draw_text(x, y - 60, f"|Vc| scale: {100 * frac:.1f}%", color=ACCENT_COLOR, writer=self.gauge_writer)
 
     def _update_markers(self, wall_dt):
         current = self.simulator.state.I
@@ -421,19 +458,34 @@ class CircuitVisualizer:
         direction = -1 if current < 0 else 1
         delta_distance = direction * speed_pixels_per_sec * wall_dt
 
-        for i, marker in enumerate(self.markers):
-            self.marker_distances[i] = (self.marker_distances[i] + delta_distance) % self.total_path_length
-            x, y = self._point_on_path(self.marker_distances[i])
-            marker.goto(x, y)
+        self.marker_distances = (self.marker_distances + delta_distance) % self.total_path_length
+        self._place_markers()
+
+    def _place_markers(self):
+        r = CHARGE_MARKER_RADIUS
+        sx, sy = self.canvas_sx, self.canvas_sy
+        coords = self.canvas.coords
+
+        xs, ys = self.loop_path.locate_many(self.marker_distances)
+
+        for marker, x, y in zip(self.markers, xs.tolist(), ys.tolist()):
+            px, py = x * sx, y * sy
+            coords(marker, px - r, py - r, px + r, py + r)
 
     def refresh(self):
-        self._draw_static_scene()
+        # The circuit drawing never changes; it is drawn once in __init__.
         self._update_capacitor_visual_state()
         self._update_info_panel()
         self._update_help_panel()
         self._update_status_panel()
         self._update_flash_message()
-        self.screen.update()
+        if self.finished:
+            self._finished_banner()
+        # Panels are recreated on every refresh; keep the markers on top.
+        self.canvas.tag_raise("charge_marker")
+        # No screen.update(): every item is created or moved on the canvas
+        # directly and no turtle is visible, so Tk repaints on its own when
+        # control returns to mainloop between scheduled ticks.
 
     def _finished_banner(self):
         self.status_writer.clear()
@@ -442,7 +494,12 @@ class CircuitVisualizer:
         self.status_writer.write("TRANSIENT COMPLETE — press q to close", align="left", font=("Arial", 14, "bold"))
 
     def loop(self):
+        frame_period = FPS_BASE_DELAY_MS / 1000.0
+        next_frame_time = time.perf_counter()
+
         def tick():
+            nonlocal next_frame_time
+
             if self.quit_requested:
                 return
 
@@ -450,7 +507,9 @@ class CircuitVisualizer:
             wall_dt = now - self.last_wall_time
             self.last_wall_time = now
 
-            if not self.paused and self.simulator.state.t < self.total_time:
+            running = not self.paused and self.simulator.state.t < self.total_time
+
+            if running:
                 target_sim_dt = self.v_sim * wall_dt
                 remaining_to_finish = max(0.0, self.total_time - self.simulator.state.t)
                 self.sim_time_accumulator += min(target_sim_dt, remaining_to_finish)
@@ -468,15 +527,22 @@ class CircuitVisualizer:
 
                 self._update_markers(wall_dt)
 
-            self.refresh()
-
-            if self.simulator.state.t >= self.total_time:
-                self.finished = True
-                self._finished_banner()
-                self.screen.update()
+            # Paused or finished frames are static: only repaint when a flash
+            # message has just expired; key handlers refresh on their own.
+            if running or self._flash_message_expired():
+                if self.simulator.state.t >= self.total_time:
+                    self.finished = True
+                self.refresh()
 
             if not self.quit_requested:
-                self.screen.ontimer(tick, FPS_BASE_DELAY_MS)
+                # Schedule against a fixed deadline so frame cost does not
+                # stretch the period; if we fell behind, restart from now.
+                next_frame_time += frame_period
+                delay = next_frame_time - time.perf_counter()
+                if delay < 0:
+                    next_frame_time = time.perf_counter()
+                    delay = 0.0
+                self.screen.ontimer(tick, max(1, int(delay * 1000)))
 
         tick()
         self.screen.mainloop()
\ No newline at end of file